@@ -0,0 +1,101 @@
+"""
+Offline embedding backends (hashing embedder and on-disk embedding cache)
+"""
+import os
+import re
+import json
+import hashlib
+import numpy as np
+from typing import List, Dict
+
+
+class HashEmbeddingsClient:
+    """Deterministic bag-of-words embedder that needs no network or model files.
+
+    Tokens (and adjacent token pairs) are hashed into a fixed number of
+    buckets with a signed count, then L2-normalised. Quality is well below
+    a real embedding model, but it is stable across runs and machines, which
+    is what relative comparisons of chunking and index settings need.
+    """
+
+    def __init__(self, dimension: int = 512):
+        self.dimension = dimension
+        self.model = f"hash-{dimension}"
+
+    def _bucket(self, token: str):
+        digest = hashlib.md5(token.encode("utf-8")).digest()
+        index = int.from_bytes(digest[:4], "little") % self.dimension
+        sign = 1.0 if digest[4] & 1 else -1.0
+        return index, sign
+
+    def get_embedding(self, text: str) -> List[float]:
+        """Get embedding for a single text"""
+        vector = np.zeros(self.dimension, dtype="float32")
+        tokens = re.findall(r"\w+", text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            index, sign = self._bucket(feature)
+            vector[index] += sign
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts"""
+        return [self.get_embedding(text) for text in texts]
+
+
+class CachedEmbeddingsClient:
+    """Wraps an embeddings client with a JSON cache keyed by model and text.
+
+    Once every text has been embedded a single time the wrapped client is no
+    longer contacted, so benchmark runs can be repeated offline. With
+    ``offline=True`` a cache miss raises instead of calling the backend.
+    """
+
+    def __init__(self, client, cache_path: str, offline: bool = False, model: str = None):
+        self.client = client
+        self.cache_path = cache_path
+        self.offline = offline or client is None
+        self.model = model or getattr(client, "model", "unknown")
+        self.cache: Dict[str, List[float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.exists(cache_path):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                self.cache = json.load(f)
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\n{text}".encode("utf-8")).hexdigest()
+
+    def get_embedding(self, text: str) -> List[float]:
+        """Get embedding for a single text, using the cache when possible"""
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts, only sending cache misses upstream"""
+        keys = [self._key(text) for text in texts]
+        missing = [i for i, key in enumerate(keys) if key not in self.cache]
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            if self.offline:
+                raise Exception(
+                    f"{len(missing)} text(s) not found in embedding cache {self.cache_path}"
+                )
+            embeddings = self.client.get_embeddings([texts[i] for i in missing])
+            for i, embedding in zip(missing, embeddings):
+                self.cache[keys[i]] = embedding
+            self.save()
+
+        return [self.cache[key] for key in keys]
+
+    def save(self):
+        """Save cache to disk"""
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f)
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -18,6 +19,7 @@ from embeddings_client import EmbeddingsClient
 from vector_store import VectorStore
 from llm_client import LLMClient
 from prompts import get_chat_prompt
+from prefetch import PrefetchCache
 
 # Load environment variables (look in parent directory for .env)
 env_path = Path(__file__).parent.parent / '.env'
@@ -38,6 +40,9 @@ app.add_middleware(
 embeddings_client = None
 vector_store = None
 llm_client = None
+prefetch_cache = None
+
+EMBEDDING_TIMEOUT = 10.0  # Seconds allowed for embedding before /chat gives up
 
 
 def get_embeddings_client():
@@ -80,9 +85,43 @@ def get_llm_client():
     return llm_client
 
 
+def get_prefetch_cache():
+    """Lazy initialization of prefetch cache"""
+    global prefetch_cache
+    if prefetch_cache is None:
+        prefetch_cache = PrefetchCache(
+            retrieve_documents,
+            ttl=float(os.getenv("PREFETCH_TTL_SECONDS", 30)),
+            debounce=float(os.getenv("PREFETCH_DEBOUNCE_SECONDS", 0.3)),
+            budget=EMBEDDING_TIMEOUT,
+        )
+    return prefetch_cache
+
+
+async def retrieve_documents(question: str, timeout: float = EMBEDDING_TIMEOUT) -> list:
+    """Embed the question and search the vector store for relevant documents"""
+    import asyncio
+
+    embeddings = get_embeddings_client()
+    vector_store = get_vector_store()
+
+    # Get question embedding (with timeout)
+    try:
+        question_embedding = await asyncio.wait_for(
+            asyncio.to_thread(embeddings.get_embedding, question),
+            timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Embedding generation timed out")
+
+    # Search for relevant context (fast, local operation)
+    return vector_store.search(question_embedding, top_k=2)  # Reduced from 3 to 2 for speed
+
+
 class ChatRequest(BaseModel):
     question: str
     conversation_history: list = []
+    session_id: Optional[str] = None  # Set to reuse retrieval started via /chat/prefetch
 
 
 class ChatResponse(BaseModel):
@@ -90,6 +129,18 @@ class ChatResponse(BaseModel):
     sources: list = []
 
 
+class PrefetchRequest(BaseModel):
+    session_id: str
+    text: str
+
+
+class PrefetchResponse(BaseModel):
+    status: str  # "scheduled", "reused" or "ignored"
+
+
+MIN_PREFETCH_LENGTH = 8  # Skip drafts too short to retrieve anything useful
+
+
 @app.get("/")
 async def root():
     return {"message": "TestWise RAG Backend API", "status": "running"}
@@ -100,6 +151,27 @@ async def health():
     return {"status": "ok", "message": "RAG backend is running"}
 
 
+@app.post("/chat/prefetch", response_model=PrefetchResponse)
+async def chat_prefetch(request: PrefetchRequest):
+    """
+    Start embedding and retrieval for a draft question in the background.
+    Returns immediately; a following /chat with the same session_id and
+    matching question reuses the result.
+    """
+    cache = get_prefetch_cache()
+
+    if len(request.text.strip()) < MIN_PREFETCH_LENGTH:
+        cache.cancel(request.session_id)
+        return PrefetchResponse(status="ignored")
+
+    # Fail fast on configuration errors instead of inside the background task
+    get_embeddings_client()
+    get_vector_store()
+
+    status = cache.schedule(request.session_id, request.text)
+    return PrefetchResponse(status=status)
+
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -112,21 +184,21 @@ async def chat(request: ChatRequest):
     
     try:
         # Get clients
-        embeddings = get_embeddings_client()
-        vector_store = get_vector_store()
         llm = get_llm_client()
 
-        # Get question embedding (with timeout)
-        try:
-            question_embedding = await asyncio.wait_for(
-                asyncio.to_thread(embeddings.get_embedding, request.question),
-                timeout=10.0
-            )
-        except asyncio.TimeoutError:
-            raise HTTPException(status_code=504, detail="Embedding generation timed out")
-
-        # Search for relevant context (fast, local operation)
-        relevant_docs = vector_store.search(question_embedding, top_k=2)  # Reduced from 3 to 2 for speed
+        # Reuse documents prefetched while the user was typing, if they match
+        relevant_docs = None
+        embedding_budget = EMBEDDING_TIMEOUT
+        if request.session_id:
+            wait_start = time.time()
+            relevant_docs = await get_prefetch_cache().take(request.session_id, request.question)
+            if relevant_docs is not None:
+                print(f"⚡ Using prefetched context for session {request.session_id}")
+            # Time spent waiting on the prefetch counts against the embedding timeout
+            embedding_budget -= time.time() - wait_start
+
+        if relevant_docs is None:
+            relevant_docs = await retrieve_documents(request.question, timeout=max(embedding_budget, 0.0))
 
         # Extract context from documents (limit context length)
         context_parts = []
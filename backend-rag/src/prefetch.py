@@ -0,0 +1,137 @@
+"""
+Speculative retrieval cache for the chat endpoint
+"""
+import re
+import time
+import asyncio
+from difflib import SequenceMatcher
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a question for matching (case, whitespace, trailing punctuation)"""
+    return re.sub(r"\s+", " ", text).strip().lower().rstrip("?!. ")
+
+
+class PrefetchSlot:
+    """Retrieval work scheduled for one session's draft text"""
+
+    def __init__(self, text: str):
+        self.text = normalize_text(text)
+        self.created_at = time.monotonic()
+        self.started_at: Optional[float] = None  # When retrieval began, after the debounce
+        self.flush = asyncio.Event()  # Set when the final question arrives, skips the debounce
+        self.task: Optional[asyncio.Task] = None
+
+
+class PrefetchCache:
+    """Keeps one short-lived prefetch per session.
+
+    Each new draft for a session cancels the previous one and waits for a
+    debounce delay before embedding, so a burst of keystrokes results in a
+    single upstream call. When the final question matches the draft (exactly
+    or above ``similarity`` after normalization) the prefetched documents are
+    reused instead of embedding and searching again.
+
+    ``budget`` is the embedding timeout: take() never waits longer than what
+    is left of it since the prefetched retrieval started.
+    """
+
+    def __init__(
+        self,
+        retrieve: Callable[[str], Awaitable[List[Dict]]],
+        ttl: float = 30.0,
+        debounce: float = 0.3,
+        similarity: float = 0.95,
+        max_sessions: int = 1000,
+        budget: float = 10.0,
+    ):
+        self.retrieve = retrieve
+        self.ttl = ttl
+        self.debounce = debounce
+        self.similarity = similarity
+        self.max_sessions = max_sessions
+        self.budget = budget
+        self.slots: Dict[str, PrefetchSlot] = {}
+
+    def _matches(self, slot: PrefetchSlot, text: str) -> bool:
+        normalized = normalize_text(text)
+        if slot.text == normalized:
+            return True
+        return SequenceMatcher(None, slot.text, normalized).ratio() >= self.similarity
+
+    def _expired(self, slot: PrefetchSlot) -> bool:
+        return time.monotonic() - slot.created_at > self.ttl
+
+    def _usable(self, slot: PrefetchSlot) -> bool:
+        """Pending or finished successfully; failed or cancelled work is never reused"""
+        task = slot.task
+        return not task.done() or (not task.cancelled() and task.exception() is None)
+
+    def _discard(self, session_id: str):
+        slot = self.slots.pop(session_id, None)
+        if slot and slot.task and not slot.task.done():
+            slot.task.cancel()
+
+    def _purge(self):
+        """Drop expired slots and, if still over capacity, the oldest ones"""
+        for session_id in [s for s, slot in self.slots.items() if self._expired(slot)]:
+            self._discard(session_id)
+        while len(self.slots) >= self.max_sessions:
+            oldest = min(self.slots, key=lambda s: self.slots[s].created_at)
+            self._discard(oldest)
+
+    async def _run(self, slot: PrefetchSlot, text: str) -> List[Dict]:
+        try:
+            await asyncio.wait_for(slot.flush.wait(), timeout=self.debounce)
+        except asyncio.TimeoutError:
+            pass
+        slot.started_at = time.monotonic()
+        return await self.retrieve(text)
+
+    def schedule(self, session_id: str, text: str) -> str:
+        """Schedule retrieval for a draft and return immediately.
+
+        Returns "reused" if an equivalent draft is already pending or has
+        succeeded, otherwise "scheduled".
+        """
+        slot = self.slots.get(session_id)
+        if (slot and not self._expired(slot) and slot.text == normalize_text(text)
+                and self._usable(slot)):
+            return "reused"
+
+        self._discard(session_id)
+        self._purge()
+
+        slot = PrefetchSlot(text)
+        slot.task = asyncio.create_task(self._run(slot, text))
+        # Failures are surfaced to take(); avoid "exception was never retrieved" warnings
+        slot.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self.slots[session_id] = slot
+        return "scheduled"
+
+    def cancel(self, session_id: str):
+        """Cancel any pending prefetch for a session"""
+        self._discard(session_id)
+
+    async def take(self, session_id: str, question: str) -> Optional[List[Dict]]:
+        """Consume the session's prefetch if it matches the question.
+
+        Returns the prefetched documents, or None if there is no usable
+        prefetch (missing, expired, different text or failed).
+        """
+        slot = self.slots.pop(session_id, None)
+        if slot is None:
+            return None
+        if self._expired(slot) or not self._matches(slot, question):
+            if not slot.task.done():
+                slot.task.cancel()
+            return None
+
+        slot.flush.set()
+        elapsed = time.monotonic() - slot.started_at if slot.started_at is not None else 0.0
+        try:
+            return await asyncio.wait_for(slot.task, timeout=max(self.budget - elapsed, 0.0))
+        except Exception as e:
+            print(f"⚠️  Prefetch for session {session_id} unusable: {str(e) or type(e).__name__}")
+            return None
@@ -49,11 +49,16 @@ export const ChatWidget = ({ apiUrl = 'http://localhost:8000', toolFilter }: Cha
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const inputRef = useRef<HTMLInputElement>(null);
   const messagesContainerRef = useRef<HTMLDivElement>(null);
+  // Stable per-widget id so /chat can reuse retrieval started by /chat/prefetch
+  const sessionIdRef = useRef(`${Date.now()}-${Math.random().toString(36).slice(2)}`);
+  const prefetchTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   // ==========================================================================
   // Constants
   // ==========================================================================
   const tools = ['all', 'Selenium', 'Playwright', 'Testim', 'Mabl'];
+  const PREFETCH_DEBOUNCE_MS = 250;
+  const MIN_PREFETCH_LENGTH = 8; // Same threshold as the backend
 
   // ==========================================================================
   // Effects
@@ -94,6 +99,12 @@ export const ChatWidget = ({ apiUrl = 'http://localhost:8000', toolFilter }: Cha
     }
   }, [isMinimized, checkBackendStatus]);
 
+  useEffect(() => {
+    return () => {
+      if (prefetchTimeoutRef.current) clearTimeout(prefetchTimeoutRef.current);
+    };
+  }, []);
+
   // ==========================================================================
   // Helper Functions
   // ==========================================================================
@@ -119,9 +130,38 @@ export const ChatWidget = ({ apiUrl = 'http://localhost:8000', toolFilter }: Cha
     return { answer, sources, confidence };
   };
 
+  const cancelPendingPrefetch = () => {
+    if (prefetchTimeoutRef.current) {
+      clearTimeout(prefetchTimeoutRef.current);
+      prefetchTimeoutRef.current = null;
+    }
+  };
+
   // ==========================================================================
   // Event Handlers
   // ==========================================================================
+  const handleInputChange = (value: string) => {
+    setInput(value);
+
+    // Debounced so only a pause in typing sends the draft to the backend
+    cancelPendingPrefetch();
+    if (value.trim().length < MIN_PREFETCH_LENGTH || isBackendOnline === false) return;
+
+    prefetchTimeoutRef.current = setTimeout(() => {
+      prefetchTimeoutRef.current = null;
+      fetch(`${apiUrl}/chat/prefetch`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          session_id: sessionIdRef.current,
+          text: value,
+        }),
+      }).catch(() => {
+        // Prefetch is best-effort; /chat retrieves on its own if it did not happen
+      });
+    }, PREFETCH_DEBOUNCE_MS);
+  };
+
   const handleSend = async () => {
     if (!input.trim() || isLoading) return;
 
@@ -132,6 +172,7 @@ export const ChatWidget = ({ apiUrl = 'http://localhost:8000', toolFilter }: Cha
       timestamp: new Date(),
     };
 
+    cancelPendingPrefetch();
     setMessages(prev => [...prev, userMessage]);
     setInput('');
     setIsLoading(true);
@@ -149,6 +190,7 @@ export const ChatWidget = ({ apiUrl = 'http://localhost:8000', toolFilter }: Cha
         body: JSON.stringify({
           question: userMessage.content,
           tool_filter: filter,
+          session_id: sessionIdRef.current,
         }),
         signal: controller.signal,
       });
@@ -507,7 +549,7 @@ export const ChatWidget = ({ apiUrl = 'http://localhost:8000', toolFilter }: Cha
             ref={inputRef}
             type="text"
             value={input}
-            onChange={(e) => setInput(e.target.value)}
+            onChange={(e) => handleInputChange(e.target.value)}
             onKeyPress={handleKeyPress}
             placeholder="Ask about testing tools..."
             className="flex-1 px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-1 focus:ring-[#A18FFF] focus:border-[#A18FFF] text-sm bg-white transition-all disabled:bg-gray-100 disabled:cursor-not-allowed"
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Offline retrieval quality and latency benchmark over the knowledge base.
+
+For each configuration (chunking, top_k, FAISS index type) the kb/ index is
+built from scratch, every question of the golden set is run against it and
+recall@k, hit rate@k, MRR, search latency percentiles, build time and index size are
+reported as JSON so runs can be compared over time.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+
+# Add backend-rag/src to path
+sys.path.insert(0, str(project_root / "backend-rag" / "src"))
+
+from text_splitter import TextSplitter
+from local_embeddings import HashEmbeddingsClient, CachedEmbeddingsClient
+
+# "server-default" mirrors src/main.py (TextSplitter defaults, top_k=2,
+# IndexFlatL2). "ingest-script" approximates max_tokens=400, overlap=50 from
+# ingest_kb.py at ~4 characters per token.
+DEFAULT_CONFIGS = [
+    {"name": "server-default", "chunk_size": 1000, "chunk_overlap": 200, "top_k": 2, "index": "Flat"},
+    {"name": "server-default-k5", "chunk_size": 1000, "chunk_overlap": 200, "top_k": 5, "index": "Flat"},
+    {"name": "ingest-script", "chunk_size": 1600, "chunk_overlap": 200, "top_k": 2, "index": "Flat"},
+    {"name": "small-chunks", "chunk_size": 500, "chunk_overlap": 100, "top_k": 2, "index": "Flat"},
+    {"name": "server-default-hnsw", "chunk_size": 1000, "chunk_overlap": 200, "top_k": 2, "index": "HNSW32"},
+]
+
+
+def log(message: str):
+    """Progress output goes to stderr so stdout stays valid JSON."""
+    print(message, file=sys.stderr)
+
+
+def load_kb(kb_dir: str) -> list:
+    """Load (source, text) pairs; source is the path relative to kb_dir."""
+    kb_path = Path(kb_dir)
+    if not kb_path.exists():
+        raise ValueError(f"Knowledge base directory not found: {kb_dir}")
+
+    documents = []
+    for filepath in sorted(kb_path.rglob("*")):
+        if filepath.suffix.lower() not in (".md", ".html", ".txt"):
+            continue
+        with open(filepath, "r", encoding="utf-8") as f:
+            documents.append((filepath.relative_to(kb_path).as_posix(), f.read()))
+    return documents
+
+
+def load_golden_set(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+    for item in golden:
+        if not item.get("question") or not item.get("expected_sources"):
+            raise ValueError(f"Golden set entry needs question and expected_sources: {item}")
+    return golden
+
+
+def get_embedder(args):
+    """Build the embedding backend; none of the options require the network
+    once the cache is warm."""
+    if args.embedder == "hash":
+        return HashEmbeddingsClient(dimension=args.hash_dimension)
+
+    cache_path = args.embedding_cache or str(project_root / "backend-rag" / "data" / "embedding_cache.json")
+    client = None
+    if not args.offline:
+        from dotenv import load_dotenv
+        from embeddings_client import EmbeddingsClient
+        load_dotenv(project_root / "backend-rag" / ".env")
+        client = EmbeddingsClient(os.getenv("OPENAI_API_KEY"))
+    return CachedEmbeddingsClient(client, cache_path, offline=args.offline, model="text-embedding-3-small")
+
+
+def build_index(spec: str, vectors: np.ndarray):
+    """Create a FAISS index from a factory string (e.g. "Flat", "HNSW32")."""
+    index = faiss.index_factory(vectors.shape[1], spec)
+    if not index.is_trained:
+        index.train(vectors)
+    index.add(vectors)
+    return index
+
+
+def percentiles(samples: list) -> dict:
+    values = np.array(samples) * 1000.0
+    return {
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p90": float(np.percentile(values, 90)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def run_config(config: dict, documents: list, golden: list, query_vectors: np.ndarray,
+               embedder, repeat: int, details: bool) -> dict:
+    """Build the index for one configuration and evaluate the golden set."""
+    top_k = config["top_k"]
+
+    build_start = time.perf_counter()
+    splitter = TextSplitter(config["chunk_size"], config["chunk_overlap"])
+    texts, metadata = [], []
+    for source, text in documents:
+        for chunk in splitter.split_text(text):
+            texts.append(chunk)
+            metadata.append({"text": chunk, "source": source})
+
+    embed_start = time.perf_counter()
+    vectors = np.array(embedder.get_embeddings(texts)).astype("float32")
+    embed_time = time.perf_counter() - embed_start
+
+    index = build_index(config["index"], vectors)
+    build_time = time.perf_counter() - build_start
+
+    search_times = []
+    recalls, hits, reciprocal_ranks, per_query = [], [], [], []
+    for i, item in enumerate(golden):
+        expected = set(item["expected_sources"])
+        query = query_vectors[i:i + 1]
+
+        for _ in range(repeat):
+            search_start = time.perf_counter()
+            _, indices = index.search(query, min(top_k, index.ntotal))
+            retrieved = [metadata[idx]["source"] for idx in indices[0] if 0 <= idx < len(metadata)]
+            search_times.append(time.perf_counter() - search_start)
+
+        rank = next((r for r, source in enumerate(retrieved, start=1) if source in expected), None)
+        # recall: share of expected sources retrieved; hit rate: any expected source retrieved
+        recalls.append(len(set(retrieved) & expected) / len(expected))
+        hits.append(1.0 if rank else 0.0)
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+        if details:
+            per_query.append({"question": item["question"], "retrieved": retrieved, "rank": rank})
+
+    result = {
+        "config": config,
+        "num_chunks": len(texts),
+        f"recall@{top_k}": float(np.mean(recalls)),
+        f"hit_rate@{top_k}": float(np.mean(hits)),
+        f"mrr@{top_k}": float(np.mean(reciprocal_ranks)),
+        "search_latency_ms": percentiles(search_times),
+        "build_time_s": build_time,
+        "embed_time_s": embed_time,
+        "index_bytes": int(faiss.serialize_index(index).nbytes),
+        "metadata_bytes": len(json.dumps(metadata, ensure_ascii=False).encode("utf-8")),
+    }
+    if details:
+        result["queries"] = per_query
+    return result
+
+
+def run_benchmark(args) -> dict:
+    documents = load_kb(args.dir)
+    golden = load_golden_set(args.golden)
+    configs = DEFAULT_CONFIGS
+    if args.configs:
+        with open(args.configs, "r", encoding="utf-8") as f:
+            configs = json.load(f)
+
+    embedder = get_embedder(args)
+    log(f"Loaded {len(documents)} documents and {len(golden)} golden questions")
+
+    query_start = time.perf_counter()
+    query_vectors = np.array(embedder.get_embeddings([item["question"] for item in golden])).astype("float32")
+    query_embed_time = time.perf_counter() - query_start
+
+    results = []
+    for config in configs:
+        log(f"Running configuration: {config['name']}")
+        result = run_config(config, documents, golden, query_vectors, embedder, args.repeat, args.details)
+        top_k = config["top_k"]
+        log(f"  recall@{top_k}={result[f'recall@{top_k}']:.3f} "
+            f"hit_rate@{top_k}={result[f'hit_rate@{top_k}']:.3f} "
+            f"mrr@{top_k}={result[f'mrr@{top_k}']:.3f} "
+            f"p50={result['search_latency_ms']['p50']:.3f}ms")
+        results.append(result)
+
+    embedder_info = {
+        "backend": args.embedder,
+        "model": embedder.model,
+        "query_embed_time_s": query_embed_time,
+    }
+    if isinstance(embedder, CachedEmbeddingsClient):
+        embedder_info["cache_hits"] = embedder.hits
+        embedder_info["cache_misses"] = embedder.misses
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "kb_dir": args.dir,
+        "golden_set": args.golden,
+        "num_documents": len(documents),
+        "num_questions": len(golden),
+        "embedder": embedder_info,
+        "faiss_version": faiss.__version__,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark retrieval quality and latency over the knowledge base")
+    parser.add_argument("--dir", default=str(project_root / "kb"), help="Knowledge base directory")
+    parser.add_argument("--golden", default=str(project_root / "scripts" / "retrieval_golden.json"),
+                        help="Golden question set (JSON)")
+    parser.add_argument("--configs", help="JSON file with a list of configurations to compare")
+    parser.add_argument("--embedder", choices=["hash", "cached"], default="hash",
+                        help="hash: local hashing embedder; cached: OpenAI embeddings through an on-disk cache")
+    parser.add_argument("--hash-dimension", type=int, default=512, help="Dimension of the hash embedder")
+    parser.add_argument("--embedding-cache", help="Embedding cache file for --embedder cached")
+    parser.add_argument("--offline", action="store_true",
+                        help="With --embedder cached, fail on cache misses instead of calling OpenAI")
+    parser.add_argument("--repeat", type=int, default=5, help="Times each query is searched for latency stats")
+    parser.add_argument("--details", action="store_true", help="Include per-query results")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        log(f"Results saved to: {args.output}")
+    else:
+        print(output)
@@ -0,0 +1,6 @@
+#!/bin/bash
+# Run offline retrieval benchmark
+
+cd "$(dirname "$0")/.."
+mkdir -p benchmarks
+python scripts/benchmark_retrieval.py --dir kb --output "benchmarks/retrieval_$(date +%Y%m%d_%H%M%S).json" "$@"